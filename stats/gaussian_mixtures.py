@@ -1,20 +1,24 @@
 import numpy as np
-from scipy import stats
+from scipy.linalg import solve_triangular
+
+_INV_SQRT_2PI = 0.3989422804014327  # 1 / sqrt(2 * pi)
+_LOG_2PI = 1.8378770664093453  # log(2 * pi)
 
 
 def gaussian_mixture_pdf(x, weights, means, variances):
     """
-    Compute the probability density function of a Gaussian Mixture Model.
+    Compute the probability density function of a univariate Gaussian Mixture
+    Model.
 
     Parameters
     ----------
-    x : array_like, shape (n_samples, n_features)
+    x : array_like, shape (n_samples,) or (n_samples, 1)
         Points where the PDF is evaluated.
-    weights : array_like, shape (n_components,)
+    weights : array_like, shape (n_components,) or (n_components, 1)
         Weights of each Gaussian component. Must sum to 1.
-    means : array_like, shape (n_components, n_features)
+    means : array_like, shape (n_components,) or (n_components, 1)
         Means of each Gaussian component.
-    variances : array_like, shape (n_components, n_features)
+    variances : array_like, shape (n_components,) or (n_components, 1)
         Variances of each Gaussian component.
 
     Returns
@@ -27,26 +31,99 @@ def gaussian_mixture_pdf(x, weights, means, variances):
     ValueError
         If weights don't sum to 1, or if means/covariances have incorrect shapes.
     """
-    x = np.atleast_1d(np.asarray(x))
-    weights = np.atleast_1d(np.asarray(weights))
-    means = np.atleast_1d(np.asarray(means))
-    variances = np.atleast_1d(np.asarray(variances))
-    n_components = len(weights)
+    x = np.atleast_1d(np.asarray(x, dtype=np.float64))
+    weights = np.asarray(weights, dtype=np.float64).reshape(-1)
+    means = np.asarray(means, dtype=np.float64)
+    variances = np.asarray(variances, dtype=np.float64)
+    n_components = weights.size
+
+    if x.ndim > 2 or (x.ndim == 2 and x.shape[1] != 1):
+        raise ValueError("x must be of shape (n_samples,) or (n_samples, 1).")
+    x = x.reshape(-1)
 
-    if weights.sum() != 1:
+    if not np.isclose(weights.sum(), 1.0, rtol=0.0, atol=1e-10):
         raise ValueError("Weights must sum to 1.")
 
-    if means.shape[0] != n_components:
+    if means.size != n_components or means.shape[0] != n_components:
         raise ValueError("Means must be of shape (n_components,).")
+    means = means.reshape(n_components)
 
-    if variances.shape[0] != n_components:
+    if variances.size != n_components or variances.shape[0] != n_components:
         raise ValueError("Variances must be of shape (n_components,).")
+    variances = variances.reshape(n_components)
 
-    pdf_values = np.zeros(x.shape[0])
+    # Evaluate all components at once on a (n_samples, n_components) grid
+    inv_s = 1.0 / np.sqrt(variances)
+    z = (x[:, None] - means[None, :]) * inv_s
+    pdf_values = (np.exp(-0.5 * z * z) * (inv_s * _INV_SQRT_2PI)) @ weights
+
+    return pdf_values
+
+
+def multivariate_gaussian_mixture_pdf(x, weights, means, covariances):
+    """
+    Compute the probability density function of a multivariate Gaussian
+    Mixture Model.
 
-    for i in range(n_components):
-        pdf_values += weights[i] * stats.norm.pdf(
-            x, loc=means[i], scale=np.sqrt(variances[i])
+    All covariance matrices are factorized in a single batched Cholesky
+    decomposition, and the Mahalanobis distances of every point to every
+    component are obtained from one batched triangular solve.
+
+    Parameters
+    ----------
+    x : array_like, shape (n_samples, n_features) or (n_samples,)
+        Points where the PDF is evaluated. A 1-D x is treated as n_samples
+        points with a single feature.
+    weights : array_like, shape (n_components,)
+        Weights of each Gaussian component. Must sum to 1.
+    means : array_like, shape (n_components, n_features)
+        Means of each Gaussian component.
+    covariances : array_like, shape (n_components, n_features, n_features)
+        Covariance matrices of each Gaussian component.
+
+    Returns
+    -------
+    ndarray, shape (n_samples,)
+        The computed PDF values at each point in x.
+
+    Raises
+    ------
+    ValueError
+        If weights don't sum to 1, or if means/covariances have incorrect shapes.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if x.ndim == 1:
+        x = x[:, None]
+    weights = np.asarray(weights, dtype=np.float64)
+    means = np.asarray(means, dtype=np.float64)
+    covariances = np.asarray(covariances, dtype=np.float64)
+
+    if x.ndim != 2:
+        raise ValueError("x must be of shape (n_samples, n_features).")
+
+    if weights.ndim != 1:
+        raise ValueError("Weights must be of shape (n_components,).")
+
+    n_components = len(weights)
+    n_features = x.shape[1]
+
+    if not np.isclose(weights.sum(), 1.0, rtol=0.0, atol=1e-10):
+        raise ValueError("Weights must sum to 1.")
+
+    if means.shape != (n_components, n_features):
+        raise ValueError("Means must be of shape (n_components, n_features).")
+
+    if covariances.shape != (n_components, n_features, n_features):
+        raise ValueError(
+            "Covariances must be of shape (n_components, n_features, n_features)."
         )
 
+    chol = np.linalg.cholesky(covariances)  # (K, D, D)
+    diff = x[None, :, :] - means[:, None, :]  # (K, N, D)
+    z = solve_triangular(chol, diff.transpose(0, 2, 1), lower=True)  # (K, D, N)
+    maha = np.einsum("kdn,kdn->kn", z, z)
+    logdet = 2.0 * np.log(np.diagonal(chol, axis1=1, axis2=2)).sum(axis=-1)
+    log_pdf = -0.5 * (maha + logdet[:, None] + n_features * _LOG_2PI)
+    pdf_values = weights @ np.exp(log_pdf)
+
     return pdf_values
@@ -12,23 +12,26 @@ def simulate_brownian_motion(T, n_steps, n_mc, seed=1234):
         Number of time steps.
     n_mc : int
         Number of Monte Carlo paths.
-    seed : int, optional
-        Random seed for reproducibility.
+    seed : int or np.random.Generator, optional
+        Seed (or generator) passed to ``np.random.default_rng``.
 
     Returns
     -------
     tab_t : ndarray
         Time grid of shape (n_steps+1,).
     bm_paths : ndarray
-        Brownian motion paths of shape (n_steps+1, n_mc).
+        Brownian motion paths of shape (n_steps+1, n_mc). This is a
+        transposed view of a path-major (n_mc, n_steps+1) array.
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     dt = T / n_steps
-    increments = np.random.normal(0, np.sqrt(dt), size=(n_steps, n_mc))
+    # Paths are stored row-wise so the cumsum runs along the contiguous axis
+    increments = rng.standard_normal((n_mc, n_steps))
+    increments *= np.sqrt(dt)
     tab_t = np.linspace(0, T, n_steps + 1)
-    bm_paths = np.cumsum(increments, axis=0)
-    bm_paths = np.insert(bm_paths, 0, 0, axis=0)  # insert B_0 = 0 at the beginning
-    return tab_t, bm_paths
+    bm_paths = np.zeros((n_mc, n_steps + 1))  # B_0 = 0 in the first column
+    np.cumsum(increments, axis=1, out=bm_paths[:, 1:])
+    return tab_t, bm_paths.T
 
 
 def simulate_brownian_bridge(a, b, t0, t1, n_steps, n_mc, seed=1234):
@@ -44,27 +47,46 @@ def simulate_brownian_bridge(a, b, t0, t1, n_steps, n_mc, seed=1234):
         Number of time steps.
     n_mc : int
         Number of Monte Carlo paths.
-    seed : int, optional
-        Random seed for reproducibility.
+    seed : int or np.random.Generator, optional
+        Seed (or generator) passed to ``np.random.default_rng``.
 
     Returns
     -------
     tab_t : ndarray
         Time grid of shape (n_steps+1,).
     bridge_paths : ndarray
-        Brownian bridge paths of shape (n_steps+1, n_mc).
+        Brownian bridge paths of shape (n_steps+1, n_mc). This is a
+        transposed view of a path-major (n_mc, n_steps+1) array.
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     T = t1 - t0
     dt = T / n_steps
-    increments = np.random.normal(0, np.sqrt(dt), size=(n_steps, n_mc))
+    # Paths are stored row-wise so the cumsum runs along the contiguous axis
+    increments = rng.standard_normal((n_mc, n_steps))
+    increments *= np.sqrt(dt)
     tab_t = np.linspace(t0, t1, n_steps + 1)
-    bm_paths = np.cumsum(increments, axis=0)
-    bm_paths = np.insert(bm_paths, 0, 0, axis=0)  # insert B_0 = 0 at the beginning
-    # Adjust to create the bridge
-    bridge_paths = bm_paths - (tab_t[:, None] - t0) / T * (bm_paths[-1, :] - (b - a))
-    bridge_paths += a  # start at a
-    return tab_t, bridge_paths
+    # The bridge B_t - (t - t0) / T * (B_T - (b - a)) + a is linear in B, so the
+    # correction is folded into the increments: each one is shifted by
+    # (B_T - (b - a)) / n_steps and a is added to the first, yielding the
+    # bridge in a single cumsum without any full-size temporary.
+    drift = (increments.sum(axis=1) - (b - a)) / n_steps
+    increments -= drift[:, None]
+    increments[:, 0] += a
+    bridge_paths = np.empty((n_mc, n_steps + 1))
+    bridge_paths[:, 0] = a  # start at a
+    np.cumsum(increments, axis=1, out=bridge_paths[:, 1:])
+    return tab_t, bridge_paths.T
+
+
+def _dyadic_position(j, t):
+    """Locate t within the dyadic intervals [k / 2^j, (k+1) / 2^j).
+
+    Returns the interval index k (clipped to [0, 2^j - 1]) and the relative
+    position u = t * 2^j - k of each time point.
+    """
+    s = t * 2**j
+    k = np.clip(s.astype(np.int64), 0, 2**j - 1)
+    return k, s - k
 
 
 def generate_haar_functions(j:int, t):
@@ -79,21 +101,16 @@ def generate_haar_functions(j:int, t):
 
     Returns
     -------
-    list of ndarray
-        List of 2^j Haar functions H_{2^j+k} for k=0,...,2^j-1.
+    ndarray
+        Array of shape (2^j, len(t)) whose row k is the Haar function
+        H_{2^j+k} for k=0,...,2^j-1.
     """
-
-    haar_functions = []
-
-    for k in range(2**j):
-        t_min = k / 2**j
-        t_mid = (k + 0.5) / 2**j
-        t_max = (k + 1) / 2**j
-        haar_functions.append(
-            2 ** (j / 2) * (t >= t_min) * (t < t_mid)
-            - 2 ** (j / 2) * (t >= t_mid) * (t < t_max)
-            + 0.0 * t
-        )
+    t = np.atleast_1d(np.asarray(t, dtype=np.float64))
+    haar_functions = np.zeros((2**j, t.size))
+    # Each t in [0, 1) lies in the support of exactly one function
+    idx = np.flatnonzero((t >= 0.0) & (t < 1.0))
+    k, u = _dyadic_position(j, t[idx])
+    haar_functions[k, idx] = np.where(u < 0.5, 2 ** (j / 2), -(2 ** (j / 2)))
 
     return haar_functions
 
@@ -110,21 +127,16 @@ def generate_schauder_functions(j, t):
 
     Returns
     -------
-    list of ndarray
-        List of 2^j Schauder functions S_{2^j+k} for k=0,...,2^j-1.
+    ndarray
+        Array of shape (2^j, len(t)) whose row k is the Schauder function
+        S_{2^j+k} for k=0,...,2^j-1.
     """
-
-    schauder_functions = []
-
-    for k in range(2**j):
-        t_min = k / 2**j
-        t_mid = (k + 0.5) / 2**j
-        t_max = (k + 1) / 2**j
-        schauder_functions.append(
-            2 ** (j / 2) * (t - t_min) * (t >= t_min) * (t < t_mid)
-            + 2 ** (j / 2) * ((k + 1) / 2**j - t) * (t >= t_mid) * (t < t_max)
-            + 0.0 * t
-        )
+    t = np.atleast_1d(np.asarray(t, dtype=np.float64))
+    schauder_functions = np.zeros((2**j, t.size))
+    # Each t in [0, 1) lies in the support of exactly one function
+    idx = np.flatnonzero((t >= 0.0) & (t < 1.0))
+    k, u = _dyadic_position(j, t[idx])
+    schauder_functions[k, idx] = 2 ** (-j / 2) * (0.5 - np.abs(u - 0.5))
 
     return schauder_functions
 
@@ -138,21 +150,33 @@ def simulate_brownian_levy_construction(t, L, seed=1234):
         Time points for evaluation.
     L : int
         Maximum level of Schauder expansion.
-    seed : int, optional
-        Random seed for reproducibility.
+    seed : int or np.random.Generator, optional
+        Seed (or generator) passed to ``np.random.default_rng``.
 
     Returns
     -------
     ndarray
         Brownian motion values at times t.
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     N_L = 2 ** (L + 1)
-    Z = np.random.normal(0, 1, N_L)
-    t = np.array(np.atleast_1d(t))
+    Z = rng.standard_normal(N_L)
+    t = np.array(np.atleast_1d(t), dtype=np.float64)
+    return _levy_kernel(t, Z, L)
+
+
+def _levy_kernel(t, Z, L):
+    """Evaluate the Schauder expansion sum_n Z_n S_n(t) up to level L.
+
+    The Schauder functions of level j have disjoint supports partitioning
+    [0, 1], so at each time only the function with index
+    k = floor(t * 2^j) is nonzero. This evaluates that single tent per
+    level, for O(len(t) * L) work instead of O(len(t) * 2^L).
+    """
     brownian_levy = t * Z[0]
+    inside = (t >= 0.0) & (t <= 1.0)
     for j in range(L + 1):
-        schauder_functions = generate_schauder_functions(j, t)
-        for k in range(2**j):
-            brownian_levy += schauder_functions[k] * Z[2**j + k]
+        k, u = _dyadic_position(j, t)
+        tent = np.where(inside, 0.5 - np.abs(u - 0.5), 0.0)
+        brownian_levy += 2 ** (-j / 2) * tent * Z[2**j + k]
     return brownian_levy
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 
 
@@ -23,14 +25,20 @@ def nelson_siegel(tau, beta0, beta1, beta2, lbd):
     float or ndarray
         Yield curve values.
     """
-    exp_term = (1.0 - np.exp(-lbd * tau)) / (lbd * tau)
-    return beta0 + beta1 * exp_term + beta2 * (exp_term - np.exp(-lbd * tau))
+    x = lbd * tau
+    em1 = np.expm1(-x)  # exp(-x) - 1, accurate for small x
+    exp_term = -em1 / x
+    return beta0 + beta1 * exp_term + beta2 * (exp_term - (1.0 + em1))
 
 
 def nelson_siegel_loadings(tau, lbd):
     """
     Compute the Nelson-Siegel factor loadings.
 
+    Loadings are cached on the raw bytes of tau and on lbd, so repeated calls
+    on the same maturity grid and decay parameter, e.g. when filtering with a
+    fixed lbd, return the same array without recomputing it.
+
     Parameters
     ----------
     tau : array_like
@@ -41,11 +49,25 @@ def nelson_siegel_loadings(tau, lbd):
     Returns
     -------
     ndarray
-        Factor loadings matrix of shape (len(tau), 3).
+        Factor loadings matrix of shape (len(tau), 3). The array is read-only
+        and shared between callers with the same (tau, lbd), so in-place
+        updates such as ``L *= w`` raise; use ``L.copy()`` if needed.
     """
-    tau = np.asarray(tau)
-    exp_term = (1.0 - np.exp(-lbd * tau)) / (lbd * tau)
-    loading0 = np.ones_like(tau)
-    loading1 = exp_term
-    loading2 = exp_term - np.exp(-lbd * tau)
-    return np.vstack([loading0, loading1, loading2]).T
+    tau = np.ascontiguousarray(tau, dtype=np.float64).ravel()
+    return _nelson_siegel_loadings_cached(tau.tobytes(), float(lbd))
+
+
+@lru_cache(maxsize=64)
+def _nelson_siegel_loadings_cached(tau_bytes, lbd):
+    tau = np.frombuffer(tau_bytes, dtype=np.float64)
+    x = lbd * tau
+    em1 = np.expm1(-x)  # exp(-x) - 1, accurate for small x
+    exp_term = -em1 / x
+    # Fill a C-contiguous (len(tau), 3) array directly rather than
+    # transposing a stacked (3, len(tau)) one
+    loadings = np.empty((tau.size, 3))
+    loadings[:, 0] = 1.0
+    loadings[:, 1] = exp_term
+    loadings[:, 2] = exp_term - (1.0 + em1)
+    loadings.flags.writeable = False  # shared between callers via the cache
+    return loadings